@@ -1,268 +1,549 @@
+import asyncio
+import atexit
 import hashlib
 import json
+import logging
 import os
+import queue
+import re
+import httpx
 import requests
 import smtplib
-from datetime import datetime
+import sys
+import types
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# BLAKE2b-64 digests (16 hex chars); only used for change detection, not security
+HASH_DIGEST_SIZE = 8
+# Stored with each hash; entries in any other format are re-baselined
+HASH_FORMAT = 'blake2b-64-normalized'
+
+_WHITESPACE = re.compile(rb"\s+")
+_URL_SEPARATORS = re.compile(r"[,\s]+")
+
+# Retries for connection errors and timeouts, with exponential backoff
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3
+
+# Maximum concurrent requests overall and against any single host
+MAX_CONCURRENCY = 16
+MAX_PER_HOST = 4
+
+# Discord webhook limits: message content, embed description, embeds per
+# message and combined embed text
+DISCORD_MAX_CONTENT = 2000
+DISCORD_MAX_DESCRIPTION = 4096
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_EMBED_TOTAL = 6000
+DISCORD_SITES_PER_EMBED = 20
+
+# httpx advertises (and transparently decodes) gzip, deflate and, when the
+# Brotli package is installed, br; leaving Accept-Encoding to it means the
+# header never offers an encoding the client can't decode
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+log = logging.getLogger(__name__)
+
+def setup_logging():
+    """Configure logging; records go through a queue so output never blocks the event loop"""
+    log_queue = queue.SimpleQueue()
+    # LOG_LEVEL only applies to this module; libraries (httpx, httpcore, hpack)
+    # stay at INFO on the root logger so their wire traces don't bury ours
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    # httpx logs every request at INFO; the per-URL traces here already cover that
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    atexit.register(listener.stop)
+    
+    level_name = os.getenv('LOG_LEVEL', 'INFO').upper()
+    level = logging.getLevelName(level_name)
+    if isinstance(level, int):
+        log.setLevel(level)
+    else:
+        log.setLevel(logging.INFO)
+        log.warning(f"Invalid LOG_LEVEL {level_name!r}, using INFO")
+
+def load_config():
+    """Read all configuration from environment variables once per run"""
+    return types.SimpleNamespace(
+        websites_to_monitor=os.getenv('WEBSITES_TO_MONITOR'),
+        smtp_server=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
+        smtp_port=os.getenv('SMTP_PORT', '587'),
+        sender_email=os.getenv('SENDER_EMAIL'),
+        sender_password=os.getenv('SENDER_PASSWORD'),
+        receiver_email=os.getenv('RECEIVER_EMAIL'),
+        discord_webhook_url=os.getenv('DISCORD_WEBHOOK_URL'),
+    )
 
 def debug_environment():
     """Debug environment variables and configuration"""
-    print("=== DEBUGGING ENVIRONMENT ===")
+    log.info("=== DEBUGGING ENVIRONMENT ===")
     
     # Check required environment variables
     required_vars = ['WEBSITES_TO_MONITOR', 'SENDER_EMAIL', 'SENDER_PASSWORD', 'RECEIVER_EMAIL']
     optional_vars = ['SMTP_SERVER', 'SMTP_PORT', 'DISCORD_WEBHOOK_URL']
     
-    print("Required variables:")
+    log.info("Required variables:")
     for var in required_vars:
         value = os.getenv(var)
         if value:
             # Don't print sensitive data, just confirm it exists
             if 'PASSWORD' in var or 'WEBHOOK' in var:
-                print(f"✓ {var}: [SET - {len(value)} chars]")
+                log.info(f"✓ {var}: [SET - {len(value)} chars]")
             else:
-                print(f"✓ {var}: {value}")
+                log.info(f"✓ {var}: {value}")
         else:
-            print(f"✗ {var}: NOT SET")
+            log.warning(f"✗ {var}: NOT SET")
     
-    print("\nOptional variables:")
+    log.info("\nOptional variables:")
     for var in optional_vars:
         value = os.getenv(var)
         if value:
             if 'PASSWORD' in var or 'WEBHOOK' in var:
-                print(f"✓ {var}: [SET - {len(value)} chars]")
+                log.info(f"✓ {var}: [SET - {len(value)} chars]")
             else:
-                print(f"✓ {var}: {value}")
+                log.info(f"✓ {var}: {value}")
         else:
-            print(f"- {var}: Not set (using default)")
+            log.info(f"- {var}: Not set (using default)")
     
-    print("=" * 30)
+    log.info("=" * 30)
+
+def normalize(html_bytes):
+    """Strip volatile markup from a page so cosmetic churn doesn't register as a change"""
+    tree = LexborHTMLParser(html_bytes)
+    tree.strip_tags(['script', 'style', 'noscript'])
+    # Per-request CSRF tokens change on every load
+    for node in tree.css('meta[name], input[name]'):
+        if 'csrf' in (node.attributes.get('name') or '').lower():
+            node.decompose()
+    html_bytes = (tree.html or '').encode('utf-8')
+    return _WHITESPACE.sub(b' ', html_bytes).strip()
 
-def get_page_hash(url):
-    """Get SHA256 hash of webpage content with detailed error reporting"""
+async def head_unchanged(client, url, previous):
+    """Check with a HEAD request whether the page still matches the previous entry
+    
+    A matching ETag is enough on its own. Content-Length alone can't rule out a
+    same-sized edit, so it only counts together with an unchanged Last-Modified.
+    Any error just means the caller should fall back to a full GET.
+    """
+    try:
+        response = await client.head(url, timeout=10)
+        if response.status_code != 200:
+            return False
+        etag = response.headers.get('ETag')
+        if etag and etag == previous.get('etag'):
+            return True
+        last_modified = response.headers.get('Last-Modified')
+        content_length = response.headers.get('Content-Length')
+        return bool(
+            last_modified and last_modified == previous.get('last_modified')
+            and content_length and content_length == previous.get('content_length')
+        )
+    except httpx.HTTPError:
+        return False
+
+async def fetch_hash(client, url, previous=None):
+    """Get BLAKE2b-64 hash of webpage content with detailed error reporting
+    
+    Returns a state entry {"hash", "etag", "last_modified", "content_length"} for
+    the URL. When the previous entry carries validators a HEAD request is tried
+    first and the GET is conditional; either way an unchanged page reuses the
+    previous hash without downloading the body.
+    """
     try:
-        print(f"Fetching: {url}")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        print(f"Status code: {response.status_code}")
-        response.raise_for_status()
+        log.debug("Fetching: %s", url)
+        headers = {}
+        # Only trust validators paired with a hash in the current format
+        if previous and previous.get('format') == HASH_FORMAT:
+            # Only worth a HEAD when it can confirm the page: a stored ETag, or
+            # Last-Modified and Content-Length together
+            can_head = previous.get('etag') or (previous.get('last_modified') and previous.get('content_length'))
+            if can_head and await head_unchanged(client, url, previous):
+                log.debug("HEAD shows no change, reusing previous hash for %s", url)
+                return previous
+            if previous.get('etag'):
+                headers['If-None-Match'] = previous['etag']
+            if previous.get('last_modified'):
+                headers['If-Modified-Since'] = previous['last_modified']
+        
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with client.stream('GET', url, headers=headers) as response:
+                    log.debug("Status code for %s: %s (%s)", url, response.status_code, response.http_version)
+                    if response.status_code == 304:
+                        log.debug("Not modified, reusing previous hash for %s", url)
+                        return previous
+                    response.raise_for_status()
+                    
+                    # HTML is buffered so it can be normalized; anything else is
+                    # streamed straight into the hasher
+                    is_html = 'html' in response.headers.get('Content-Type', '')
+                    hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+                    body = bytearray()
+                    content_length = 0
+                    async for chunk in response.aiter_bytes(65536):
+                        if is_html:
+                            body += chunk
+                        else:
+                            hasher.update(chunk)
+                        content_length += len(chunk)
+                    if is_html:
+                        # Parsing and hashing a large page is CPU-bound; run it in a
+                        # worker thread so the other downloads keep progressing
+                        await asyncio.to_thread(lambda: hasher.update(normalize(bytes(body))))
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    wire_length = response.headers.get('Content-Length')
+                break
+            # TransportError covers timeouts, network errors and protocol errors
+            # such as a stale keep-alive connection the server already closed
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = RETRY_BACKOFF * (2 ** attempt)
+                log.debug("Retrying %s in %.1fs", url, delay)
+                await asyncio.sleep(delay)
         
-        content_length = len(response.text)
-        print(f"Content length: {content_length} characters")
+        log.debug("Content length for %s: %s bytes", url, content_length)
         
-        page_hash = hashlib.sha256(response.text.encode()).hexdigest()
-        print(f"Hash: {page_hash[:16]}...")
-        return page_hash
+        page_hash = sys.intern(hasher.hexdigest())
+        log.debug("Hash for %s: %s", url, page_hash)
+        entry = {'hash': page_hash, 'format': HASH_FORMAT}
+        if etag:
+            entry['etag'] = etag
+        if last_modified:
+            entry['last_modified'] = last_modified
+        if wire_length:
+            entry['content_length'] = wire_length
+        return entry
         
-    except requests.exceptions.Timeout:
-        print(f"✗ Timeout error for {url}")
+    except httpx.TimeoutException:
+        log.warning(f"✗ Timeout error for {url}")
         return None
-    except requests.exceptions.ConnectionError:
-        print(f"✗ Connection error for {url}")
+    except httpx.HTTPStatusError as e:
+        log.warning(f"✗ HTTP error for {url}: {e.response.status_code} {e.response.reason_phrase}")
         return None
-    except requests.exceptions.HTTPError as e:
-        print(f"✗ HTTP error for {url}: {e}")
+    except httpx.TransportError:
+        log.warning(f"✗ Connection error for {url}")
         return None
     except Exception as e:
-        print(f"✗ Unexpected error for {url}: {str(e)}")
+        log.warning(f"✗ Unexpected error for {url}: {str(e)}")
         return None
 
+async def gather_all(websites, previous_hashes):
+    """Fetch and hash all websites concurrently over one shared client"""
+    # HTTP/2 multiplexes concurrent requests to the same host over one TLS
+    # connection; HTTP/1.1 hosts still get pooled keep-alive connections
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30)
+    # Cap requests overall and per host so sites sharing a domain don't get throttled
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_PER_HOST))
+    
+    async with httpx.AsyncClient(http2=True, limits=limits, headers=HEADERS, timeout=30.0, follow_redirects=True) as client:
+        async def bounded_fetch(url):
+            # Wait for the host slot first so a busy host doesn't hold global slots
+            async with host_semaphores[urlparse(url).netloc], semaphore:
+                return await fetch_hash(client, url, previous_hashes.get(url))
+        
+        return await asyncio.gather(*[bounded_fetch(url) for url in websites], return_exceptions=True)
+
 def load_previous_hashes():
     """Load previous hashes from file with error handling"""
     try:
         if os.path.exists('website_hashes.json'):
-            with open('website_hashes.json', 'r') as f:
-                data = json.load(f)
-                print(f"Loaded {len(data)} previous hashes")
+            with open('website_hashes.json', 'rb') as f:
+                raw = f.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                # Older files map each URL straight to its hash string
+                data = {url: entry if isinstance(entry, dict) else {'hash': entry}
+                        for url, entry in data.items()}
+                # Intern URLs and digests so lookups and comparisons against
+                # this run's (also interned) values hit the identity fast path
+                data = {sys.intern(url): dict(entry, hash=sys.intern(entry['hash']))
+                        for url, entry in data.items()}
+                log.info(f"Loaded {len(data)} previous hashes")
                 return data
         else:
-            print("No previous hashes file found (first run)")
+            log.info("No previous hashes file found (first run)")
             return {}
     except Exception as e:
-        print(f"Error loading previous hashes: {str(e)}")
+        log.error(f"Error loading previous hashes: {str(e)}")
         return {}
 
 def save_hashes(hashes):
-    """Save current hashes to file with error handling"""
+    """Save current hashes to file with error handling
+    
+    Writes to a temporary file and renames it over the old one, so a crash
+    mid-write can never leave a truncated file behind.
+    """
     try:
-        with open('website_hashes.json', 'w') as f:
-            json.dump(hashes, f, indent=2)
-        print(f"Saved {len(hashes)} hashes to file")
+        tmp_path = 'website_hashes.json.tmp'
+        if orjson:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(hashes, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(hashes, f, indent=2)
+        os.replace(tmp_path, 'website_hashes.json')
+        log.info(f"Saved {len(hashes)} hashes to file")
     except Exception as e:
-        print(f"Error saving hashes: {str(e)}")
+        log.error(f"Error saving hashes: {str(e)}")
+
+_smtp = None
+
+def get_smtp(config):
+    """Return the shared authenticated SMTP connection, reconnecting if it went stale"""
+    global _smtp
+    if _smtp is not None:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp = None
+    
+    server = smtplib.SMTP(config.smtp_server, int(config.smtp_port))
+    server.starttls()
+    server.login(config.sender_email, config.sender_password)
+    _smtp = server
+    return _smtp
+
+def close_smtp():
+    """Close the shared SMTP connection if one was opened"""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp = None
+
+atexit.register(close_smtp)
 
-def test_email_connection():
+def test_email_connection(config):
     """Test email connection without sending"""
     try:
-        smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        smtp_port = int(os.getenv('SMTP_PORT', '587'))
-        sender_email = os.getenv('SENDER_EMAIL')
-        sender_password = os.getenv('SENDER_PASSWORD')
+        log.info(f"Testing email connection to {config.smtp_server}:{config.smtp_port}")
+        log.info(f"Sender email: {config.sender_email}")
         
-        print(f"Testing email connection to {smtp_server}:{smtp_port}")
-        print(f"Sender email: {sender_email}")
-        
-        if not sender_email or not sender_password:
-            print("✗ Email credentials missing")
+        if not config.sender_email or not config.sender_password:
+            log.error("✗ Email credentials missing")
             return False
         
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(sender_email, sender_password)
-        server.quit()
+        get_smtp(config)
         
-        print("✓ Email connection successful")
+        log.info("✓ Email connection successful")
         return True
         
     except Exception as e:
-        print(f"✗ Email connection failed: {str(e)}")
+        log.error(f"✗ Email connection failed: {str(e)}")
         return False
 
-def send_email_notification(changed_sites):
+def send_email_notification(changed_sites, config, checked_at):
     """Send email notification for changed websites using simple SMTP"""
     try:
-        # Email configuration from environment variables
-        smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        smtp_port = int(os.getenv('SMTP_PORT', '587'))
-        sender_email = os.getenv('SENDER_EMAIL')
-        sender_password = os.getenv('SENDER_PASSWORD')
-        receiver_email = os.getenv('RECEIVER_EMAIL')
+        sender_email = config.sender_email
+        receiver_email = config.receiver_email
         
-        if not all([sender_email, sender_password, receiver_email]):
-            print("✗ Email credentials not configured properly")
+        if not all([sender_email, config.sender_password, receiver_email]):
+            log.error("✗ Email credentials not configured properly")
             return False
         
         # Create simple email message
-        subject = f"Website Changes Detected - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        body = "The following websites have changed:\n\n"
-        for site in changed_sites:
-            body += f"• {site}\n"
+        subject = f"Website Changes Detected - {checked_at}"
         
-        body += f"\nCheck performed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        body = (
+            "The following websites have changed:\n\n"
+            + "\n".join(f"• {site}" for site in changed_sites)
+            + f"\n\nCheck performed at: {checked_at}"
+        )
         
-        # Create email message string
-        message = f"""From: {sender_email}
-To: {receiver_email}
-Subject: {subject}
-
-{body}"""
+        # Build the RFC 5322 message directly; UTF-8 so the bullet characters survive
+        message = (
+            f"From: {sender_email}\r\n"
+            f"To: {receiver_email}\r\n"
+            f"Subject: {subject}\r\n"
+            f"MIME-Version: 1.0\r\n"
+            f"Content-Type: text/plain; charset=utf-8\r\n"
+            f"Content-Transfer-Encoding: 8bit\r\n"
+            f"\r\n"
+            + body.replace('\n', '\r\n')
+        )
         
         # Send email
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(sender_email, sender_password)
-        server.sendmail(sender_email, receiver_email, message)
-        server.quit()
+        server = get_smtp(config)
+        mail_options = ['BODY=8BITMIME'] if server.has_extn('8bitmime') else []
+        server.sendmail(sender_email, [receiver_email], message.encode('utf-8'), mail_options=mail_options)
         
-        print(f"✓ Email notification sent for {len(changed_sites)} changed sites")
+        log.info(f"✓ Email notification sent for {len(changed_sites)} changed sites")
         return True
         
     except Exception as e:
-        print(f"✗ Error sending email: {str(e)}")
+        log.error(f"✗ Error sending email: {str(e)}")
         return False
 
-def send_discord_notification(changed_sites):
-    """Send Discord notification via webhook"""
+def build_discord_payloads(changed_sites, checked_at):
+    """Split the change list into as few webhook payloads as Discord's size limits allow"""
+    lines = [f"• {site}" for site in changed_sites]
+    if len(lines) <= DISCORD_SITES_PER_EMBED:
+        message = (
+            "🔔 **Website Changes Detected**\n\n"
+            + "\n".join(lines)
+            + f"\n\n*Check performed at: {checked_at}*"
+        )
+        if len(message) <= DISCORD_MAX_CONTENT:
+            return [{"content": message}]
+    
+    # Longer lists go into embeds, packed as many per message as Discord accepts
+    descriptions = []
+    current, size = [], 0
+    for line in lines:
+        if current and (len(current) == DISCORD_SITES_PER_EMBED or size + len(line) > DISCORD_MAX_DESCRIPTION):
+            descriptions.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    descriptions.append("\n".join(current))
+    
+    payloads = []
+    embeds, size = [], 0
+    for description in descriptions:
+        if embeds and (len(embeds) == DISCORD_MAX_EMBEDS or size + len(description) > DISCORD_MAX_EMBED_TOTAL):
+            payloads.append(embeds)
+            embeds, size = [], 0
+        embeds.append({"description": description})
+        size += len(description)
+    payloads.append(embeds)
+    
+    header = f"🔔 **Website Changes Detected**\n*Check performed at: {checked_at}*"
+    return [{"content": header, "embeds": embeds} for embeds in payloads]
+
+def send_discord_notification(changed_sites, config, checked_at, session):
+    """Send Discord notification via webhook over the given requests session"""
     try:
-        webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+        webhook_url = config.discord_webhook_url
         if not webhook_url:
-            print("Discord webhook not configured (optional)")
+            log.info("Discord webhook not configured (optional)")
             return True
         
-        message = f"🔔 **Website Changes Detected**\n\n"
-        for site in changed_sites:
-            message += f"• {site}\n"
-        
-        message += f"\n*Check performed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}*"
-        
-        payload = {
-            "content": message
-        }
-        
-        response = requests.post(webhook_url, json=payload)
-        response.raise_for_status()
+        for payload in build_discord_payloads(changed_sites, checked_at):
+            response = session.post(webhook_url, json=payload, timeout=10)
+            response.raise_for_status()
         
-        print(f"✓ Discord notification sent for {len(changed_sites)} changed sites")
+        log.info(f"✓ Discord notification sent for {len(changed_sites)} changed sites")
         return True
         
     except Exception as e:
-        print(f"✗ Error sending Discord notification: {str(e)}")
+        log.error(f"✗ Error sending Discord notification: {str(e)}")
         return False
 
 def main():
-    print("=== WEBSITE MONITOR DEBUG VERSION ===")
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    setup_logging()
+    log.info("=== WEBSITE MONITOR DEBUG VERSION ===")
+    # Read the clock and environment once; everything below works from these
+    checked_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+    config = load_config()
+    log.info(f"Started at: {checked_at}")
     
     # Debug environment
     debug_environment()
     
     # Get websites to monitor
-    websites_env = os.getenv('WEBSITES_TO_MONITOR')
+    websites_env = config.websites_to_monitor
     if not websites_env:
-        print("✗ WEBSITES_TO_MONITOR not set!")
+        log.error("✗ WEBSITES_TO_MONITOR not set!")
         return 1
     
-    websites = [url.strip() for url in websites_env.split(',') if url.strip()]
-    print(f"\nMonitoring {len(websites)} websites:")
+    # Accept commas, spaces or newlines between URLs and drop duplicates, keeping order
+    websites = list(dict.fromkeys(sys.intern(url) for url in _URL_SEPARATORS.split(websites_env) if url))
+    log.info(f"\nMonitoring {len(websites)} websites:")
     for i, url in enumerate(websites, 1):
-        print(f"  {i}. {url}")
+        log.info(f"  {i}. {url}")
     
     # Test email connection first
-    print(f"\n=== TESTING EMAIL CONNECTION ===")
-    email_works = test_email_connection()
+    log.info(f"\n=== TESTING EMAIL CONNECTION ===")
+    email_works = test_email_connection(config)
     
     # Load previous hashes
-    print(f"\n=== LOADING PREVIOUS HASHES ===")
+    log.info(f"\n=== LOADING PREVIOUS HASHES ===")
     previous_hashes = load_previous_hashes()
     current_hashes = {}
     changed_sites = []
     
     # Check each website
-    print(f"\n=== CHECKING WEBSITES ===")
-    for i, url in enumerate(websites, 1):
-        print(f"\n[{i}/{len(websites)}] Checking: {url}")
-        current_hash = get_page_hash(url)
+    log.info(f"\n=== CHECKING WEBSITES ===")
+    results = asyncio.run(gather_all(websites, previous_hashes))
+    
+    log.info(f"\n=== COMPARING HASHES ===")
+    for i, (url, entry) in enumerate(zip(websites, results), 1):
+        log.info(f"\n[{i}/{len(websites)}] {url}")
+        if isinstance(entry, BaseException):
+            log.warning(f"✗ Unexpected error for {url}: {str(entry)}")
+            entry = None
         
-        if current_hash:
-            current_hashes[url] = current_hash
+        if entry:
+            current_hashes[url] = entry
+            current_hash = entry['hash']
+            previous = previous_hashes.get(url, {})
             
-            # Compare with previous hash
-            if url in previous_hashes:
-                if previous_hashes[url] != current_hash:
-                    print(f"🔔 CHANGE DETECTED: {url}")
+            # Compare with previous hash; entries stored in an older hash
+            # format are re-baselined instead of reported as changed
+            if previous.get('format') == HASH_FORMAT:
+                if previous['hash'] != current_hash:
+                    log.info(f"🔔 CHANGE DETECTED: {url}")
                     changed_sites.append(url)
                 else:
-                    print(f"✓ No change detected")
+                    log.info(f"✓ No change detected")
             else:
-                print(f"ℹ First time monitoring this URL")
+                log.info(f"ℹ First time monitoring this URL")
         else:
-            print(f"✗ Failed to fetch this URL")
+            log.warning(f"✗ Failed to fetch this URL")
     
     # Save current hashes
-    print(f"\n=== SAVING HASHES ===")
-    save_hashes(current_hashes)
+    log.info(f"\n=== SAVING HASHES ===")
+    if current_hashes == previous_hashes:
+        log.info("Hashes unchanged, leaving file as is")
+    else:
+        save_hashes(current_hashes)
     
     # Send notifications if changes detected
     if changed_sites:
-        print(f"\n=== SENDING NOTIFICATIONS ===")
-        print(f"Changes detected in {len(changed_sites)} sites:")
+        log.info(f"\n=== SENDING NOTIFICATIONS ===")
+        log.info(f"Changes detected in {len(changed_sites)} sites:")
         for site in changed_sites:
-            print(f"  • {site}")
+            log.info(f"  • {site}")
         
-        if email_works:
-            send_email_notification(changed_sites)
-        else:
-            print("Skipping email notification due to connection issues")
-        
-        send_discord_notification(changed_sites)
+        # Email and Discord are independent services, so notify both at once
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(send_discord_notification, changed_sites, config, checked_at, session)]
+            if email_works:
+                futures.append(executor.submit(send_email_notification, changed_sites, config, checked_at))
+            else:
+                log.info("Skipping email notification due to connection issues")
+            for future in futures:
+                future.result()
     else:
-        print(f"\n✓ No changes detected in any monitored websites")
+        log.info(f"\n✓ No changes detected in any monitored websites")
     
-    print(f"\n=== MONITORING COMPLETE ===")
-    print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    log.info(f"\n=== MONITORING COMPLETE ===")
+    log.info(f"Finished at: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
     return 0
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+import smtplib
+import socket
+import threading
+import types
+
+import monitor
+
+
+class FakeSMTPServer:
+    """Minimal SMTP server that advertises 8BITMIME and records every command"""
+
+    def __init__(self):
+        self.commands = []
+        self.sock = socket.socket()
+        self.sock.bind(('localhost', 0))
+        self.sock.listen(1)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        conn, _ = self.sock.accept()
+        with conn, conn.makefile('rb') as rfile:
+            conn.sendall(b'220 localhost ESMTP\r\n')
+            in_data = False
+            for raw in rfile:
+                line = raw.decode('utf-8').rstrip('\r\n')
+                if in_data:
+                    if line == '.':
+                        in_data = False
+                        conn.sendall(b'250 OK\r\n')
+                    continue
+                self.commands.append(line)
+                verb = line.split(' ', 1)[0].upper()
+                if verb == 'EHLO':
+                    conn.sendall(b'250-localhost\r\n250 8BITMIME\r\n')
+                elif verb == 'MAIL':
+                    # Reject unknown MAIL FROM parameters, as strict servers do
+                    params = line.split('>', 1)[1].split()
+                    if all(p.upper().startswith(('SIZE=', 'BODY=')) for p in params):
+                        conn.sendall(b'250 OK\r\n')
+                    else:
+                        conn.sendall(b'555 5.5.4 Unsupported option\r\n')
+                elif verb == 'DATA':
+                    in_data = True
+                    conn.sendall(b'354 Go ahead\r\n')
+                elif verb == 'QUIT':
+                    conn.sendall(b'221 Bye\r\n')
+                    return
+                else:
+                    conn.sendall(b'250 OK\r\n')
+
+
+def test_send_email_notification_requests_8bitmime_body(monkeypatch):
+    server = FakeSMTPServer()
+    smtp = smtplib.SMTP('localhost', server.port)
+    smtp.ehlo()
+    # get_smtp reuses a live shared connection, so skip STARTTLS/LOGIN
+    monkeypatch.setattr(monitor, '_smtp', smtp)
+    config = types.SimpleNamespace(
+        sender_email='a@example.com',
+        sender_password='secret',
+        receiver_email='b@example.com',
+    )
+
+    try:
+        assert monitor.send_email_notification(['https://example.com/'], config, 'NOW')
+    finally:
+        monitor.close_smtp()
+    server.thread.join(timeout=5)
+
+    mail_from = [c for c in server.commands if c.upper().startswith('MAIL FROM')]
+    assert mail_from == ['mail FROM:<a@example.com> BODY=8BITMIME']